@@ -1,19 +1,25 @@
 import customtkinter as ctk
 from tkinter import messagebox
 import threading
+import os
 from src.quiz_data import QuizData
 from src.timer import QuizTimer
 from src.score_report import ScoreReport
+from src.shared_bank import SharedQuestionBank
+from src.search_index import QuestionSearchIndex
+from src.result_sync import ResultOutbox
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
 class QuizApp:
-    def __init__(self, root):
+    def __init__(self, root, quiz_data=None, outbox=None):
         """
         Initialize the QuizApp with the root Tkinter window.
         Sets up the main application structure, including frames for different screens.
+        An already loaded question source (e.g. a SharedQuestionBank) can be passed in as quiz_data,
+        and a ResultOutbox as outbox to upload results to a central store.
         """
         self.root = root
         self.root.title("🎓 Quiz Master - Modern Examination System")
@@ -21,13 +27,19 @@ class QuizApp:
         self.root.resizable(False, False)
 
         # Initialize data and components
-        self.quiz_data = QuizData()
+        self.quiz_data = quiz_data if quiz_data is not None else QuizData()
         self.questions = self.quiz_data.get_questions()
         self.current_question_index = 0
         self.user_answers = {}
         self.user_name = ""
         self.timer = None
         self.score_report = None
+        self.search_index = None
+        self.search_thread = None
+        self.search_error = None
+        file_path = getattr(self.quiz_data, 'file_path', None)
+        self.search_bank_mtime = os.path.getmtime(file_path) if file_path and os.path.exists(file_path) else None
+        self.outbox = outbox
 
         # Create frames for different screens using CustomTkinter
         self.name_frame = ctk.CTkFrame(self.root)
@@ -65,7 +77,11 @@ class QuizApp:
 
         # Start button
         start_button = ctk.CTkButton(self.name_frame, text="🚀 Start Quiz", command=self.start_quiz, width=200, height=50, font=ctk.CTkFont(size=18, weight="bold"))
-        start_button.pack(pady=40)
+        start_button.pack(pady=(40, 10))
+
+        # Question bank search for editors
+        search_button = ctk.CTkButton(self.name_frame, text="🔍 Search Questions", command=self.open_search_panel, width=200, height=40, font=ctk.CTkFont(size=14))
+        search_button.pack(pady=(0, 20))
 
         # Instructions
         instructions_label = ctk.CTkLabel(self.name_frame, text="• 10-minute timer • Multiple choice questions • Instant results", font=ctk.CTkFont(size=12))
@@ -254,6 +270,12 @@ class QuizApp:
         self.score_report = ScoreReport(self.user_name, total_questions, correct_answers, time_taken)
         self.score_report.save_to_file()
         self.score_report.generate_chart()
+        if self.outbox:
+            # Uploading is optional; results are already saved locally above
+            try:
+                self.outbox.enqueue(self.score_report)
+            except OSError as e:
+                print(f"Error queueing result for upload: {e}")
 
         # Switch to result screen
         self.quiz_frame.pack_forget()
@@ -368,6 +390,142 @@ class QuizApp:
         if self.score_report:
             self.score_report.display_chart()
 
+    def _update_search_index(self):
+        """
+        Reload the question bank if its file changed on disk, then bring the search index up to date.
+        Runs in a worker thread so indexing a large bank doesn't freeze the window.
+        Any failure is kept in search_error for the search window to show.
+        """
+        self.search_error = None
+        try:
+            file_path = getattr(self.quiz_data, 'file_path', None)
+            if file_path and os.path.exists(file_path):
+                mtime = os.path.getmtime(file_path)
+                if mtime != self.search_bank_mtime:
+                    self.quiz_data.load_data()
+                    self.search_bank_mtime = mtime
+
+            if self.search_index is None:
+                self.search_index = QuestionSearchIndex(self.quiz_data)
+            else:
+                self.search_index.refresh(self.quiz_data)
+        except Exception as e:
+            print(f"Error indexing questions: {e!r}")
+            self.search_error = f"⚠️ Could not index questions: {e!r}"
+
+    def start_search_indexing(self):
+        """
+        Start updating the search index in a separate thread, unless an update is already running.
+        """
+        if self.search_thread is None or not self.search_thread.is_alive():
+            self.search_thread = threading.Thread(target=self._update_search_index, daemon=True)
+            self.search_thread.start()
+
+    def open_search_panel(self):
+        """
+        Open a window for searching the question bank by keyword.
+        Results update shortly after the user stops typing; the last word is matched as a prefix.
+        """
+        self.start_search_indexing()
+
+        search_window = ctk.CTkToplevel(self.root)
+        search_window.title("🔍 Question Bank Search")
+        search_window.geometry("900x700")
+
+        # Title
+        title_label = ctk.CTkLabel(search_window, text="Search Questions", font=ctk.CTkFont(size=24, weight="bold"))
+        title_label.pack(pady=20)
+
+        search_entry = ctk.CTkEntry(search_window, placeholder_text="Keywords (use * for prefix, e.g. colo*)", width=500, height=40, font=ctk.CTkFont(size=14))
+        search_entry.pack(pady=(0, 10))
+        search_entry.focus()
+
+        count_label = ctk.CTkLabel(search_window, text="⏳ Indexing questions...", font=ctk.CTkFont(size=12))
+        count_label.pack(pady=(0, 10))
+
+        # Scrollable frame for results
+        results_frame = ctk.CTkScrollableFrame(search_window)
+        results_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        pending_search = None
+
+        def show_results():
+            nonlocal pending_search
+            pending_search = None
+            if not search_window.winfo_exists():
+                return
+            if self.search_thread.is_alive():
+                return  # wait_for_index() shows the results once indexing finishes
+
+            for widget in results_frame.winfo_children():
+                widget.destroy()
+
+            if self.search_index is None:
+                count_label.configure(text=self.search_error or "No questions indexed")
+                return
+
+            query = search_entry.get().strip()
+            if not query:
+                count_label.configure(text=self.search_error or f"{self.search_index.get_total_questions()} questions indexed")
+                return
+
+            results = self.search_index.search(query, limit=50)
+            count_label.configure(text=self.search_error or f"Showing {len(results)} match(es)")
+            for position, question in results:
+                # Question card
+                q_frame = ctk.CTkFrame(results_frame)
+                q_frame.pack(fill="x", pady=(0, 10))
+
+                q_text = ctk.CTkLabel(q_frame, text=f"Q{position + 1}: {question['question']}", font=ctk.CTkFont(size=14), wraplength=750, justify="left")
+                q_text.pack(pady=10, padx=15, anchor="w")
+
+                options_text = "   ".join(f"{key}. {value}" for key, value in question['options'].items())
+                options_label = ctk.CTkLabel(q_frame, text=options_text, font=ctk.CTkFont(size=12), wraplength=750, justify="left")
+                options_label.pack(pady=(0, 5), padx=15, anchor="w")
+
+                ans_text = ctk.CTkLabel(q_frame, text=f"✅ Correct Answer: {question['correct']}", font=ctk.CTkFont(size=12, weight="bold"), text_color="#00FF00")
+                ans_text.pack(pady=(0, 10), padx=15, anchor="w")
+
+        def schedule_search(event=None):
+            # Debounce: only search once typing pauses
+            nonlocal pending_search
+            if pending_search is not None:
+                search_window.after_cancel(pending_search)
+            pending_search = search_window.after(250, show_results)
+
+        def wait_for_index():
+            # Poll the indexing thread from the main thread, like update_timer_label does for the timer
+            if not search_window.winfo_exists():
+                return
+            if self.search_thread.is_alive():
+                count_label.configure(text="⏳ Indexing questions...")
+                search_window.after(100, wait_for_index)
+            else:
+                show_results()
+
+        def reload_bank():
+            self.start_search_indexing()
+            wait_for_index()
+
+        def close_search_window():
+            if pending_search is not None:
+                search_window.after_cancel(pending_search)
+            search_window.destroy()
+
+        search_entry.bind('<KeyRelease>', schedule_search)
+        search_window.protocol("WM_DELETE_WINDOW", close_search_window)
+        wait_for_index()
+
+        # Buttons
+        button_container = ctk.CTkFrame(search_window, fg_color="transparent")
+        button_container.pack(pady=(0, 20))
+
+        reload_button = ctk.CTkButton(button_container, text="🔄 Reload Bank", command=reload_bank, width=140, height=40, font=ctk.CTkFont(size=14, weight="bold"))
+        reload_button.pack(side="left", padx=10)
+
+        close_button = ctk.CTkButton(button_container, text="Close", command=close_search_window, width=120, height=40, font=ctk.CTkFont(size=14, weight="bold"))
+        close_button.pack(side="left", padx=10)
+
     def restart_quiz(self):
         """
         Restart the quiz by resetting all data and going back to name screen.
@@ -384,10 +542,32 @@ class QuizApp:
 def main():
     """
     Main function to initialize and run the QuizApp.
+    If QUIZ_SHARED_BANK is set, the question bank is attached from shared memory
+    instead of being loaded from the CSV file.
+    If QUIZ_RESULTS_URL is set, results are also queued for upload to that results store.
     """
+    shared_bank_name = os.environ.get("QUIZ_SHARED_BANK")
+    quiz_data = None
+    if shared_bank_name:
+        try:
+            quiz_data = SharedQuestionBank(shared_bank_name)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error attaching to shared question bank '{shared_bank_name}': {e}")
+            print("Falling back to loading the question bank from file.")
+
+    results_url = os.environ.get("QUIZ_RESULTS_URL")
+    outbox = ResultOutbox(results_url) if results_url else None
+    if outbox:
+        outbox.start()
+
     root = ctk.CTk()
-    app = QuizApp(root)
+    app = QuizApp(root, quiz_data, outbox)
     root.mainloop()
 
+    if outbox:
+        outbox.stop()
+    if quiz_data is not None:
+        quiz_data.close()
+
 if __name__ == "__main__":
     main()
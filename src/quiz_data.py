@@ -15,9 +15,10 @@ class QuizData:
         """
         Load the quiz data from the CSV file using pandas.
         The CSV should have columns: question, option_a, option_b, option_c, option_d, correct_answer
+        All cells are read as text and empty cells become '' so every consumer sees the same values.
         """
         try:
-            self.questions_df = pd.read_csv(self.file_path)
+            self.questions_df = pd.read_csv(self.file_path, dtype=str, keep_default_na=False)
             print(f"Loaded {len(self.questions_df)} questions from {self.file_path}")
         except FileNotFoundError:
             print(f"Error: File {self.file_path} not found.")
@@ -34,17 +35,20 @@ class QuizData:
         if self.questions_df.empty:
             return []
 
+        # Walk the columns directly; iterrows() builds a Series per row and is too slow for large banks
+        columns = [self.questions_df[col].tolist() for col in
+                   ['question', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_answer']]
         questions = []
-        for _, row in self.questions_df.iterrows():
+        for question, option_a, option_b, option_c, option_d, correct in zip(*columns):
             question_dict = {
-                'question': row['question'],
+                'question': question,
                 'options': {
-                    'A': row['option_a'],
-                    'B': row['option_b'],
-                    'C': row['option_c'],
-                    'D': row['option_d']
+                    'A': option_a,
+                    'B': option_b,
+                    'C': option_c,
+                    'D': option_d
                 },
-                'correct': row['correct_answer']
+                'correct': correct
             }
             questions.append(question_dict)
         return questions
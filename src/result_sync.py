@@ -0,0 +1,336 @@
+import csv
+import glob
+import gzip
+import json
+import os
+import random
+import socket
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Columns written by ScoreReport, plus where the result came from
+STORE_COLUMNS = ['Result ID', 'Kiosk', 'Timestamp', 'User Name', 'Score', 'Percentage', 'Status', 'Time Taken']
+
+
+class ResultOutbox:
+    """
+    Durable local outbox that uploads quiz results to a central results store.
+
+    enqueue() only writes a small JSON file to disk and returns, so submitting a quiz
+    never waits on the network. A background thread collects pending results into
+    gzip-compressed batches and POSTs them to the store, retrying with exponential
+    backoff. Every result carries its own ID, which the store uses to ignore results
+    it already has, so a retried upload is never counted twice. Entries the store will
+    never accept are renamed to .bad so they cannot hold up the rest of the queue.
+    """
+    def __init__(self, endpoint, outbox_dir='results/outbox', kiosk_id=None, batch_size=100,
+                 poll_interval=30, max_backoff=300, timeout=10):
+        """
+        Initialize the outbox.
+
+        Args:
+            endpoint (str): URL of the central results store
+            outbox_dir (str): Directory holding results waiting to be uploaded
+            kiosk_id (str): Name of this kiosk (defaults to the host name)
+            batch_size (int): Maximum number of results per upload
+            poll_interval (int): Seconds between sync attempts when idle
+            max_backoff (int): Upper limit in seconds for the retry delay
+            timeout (int): Seconds to wait for the store to respond
+        """
+        self.endpoint = endpoint
+        self.outbox_dir = outbox_dir
+        self.kiosk_id = kiosk_id or socket.gethostname()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        self.failures = 0
+        self.is_running = False
+        self.sync_thread = None
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+
+        os.makedirs(self.outbox_dir, exist_ok=True)
+
+    def enqueue(self, score_report):
+        """
+        Add a completed result to the outbox and wake the sync thread.
+
+        Args:
+            score_report (ScoreReport): The result to upload
+
+        Returns:
+            str: The result ID
+        """
+        result_id = uuid.uuid4().hex
+        entry = {'id': result_id, 'kiosk': self.kiosk_id, 'record': score_report.to_record()}
+
+        # Write to a temporary file first so a crash never leaves a half-written entry
+        file_name = f"{time.time_ns()}_{result_id}.json"
+        temp_path = os.path.join(self.outbox_dir, file_name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, os.path.join(self.outbox_dir, file_name))
+
+        self.wake_event.set()
+        return result_id
+
+    def get_pending_count(self):
+        """
+        Return the number of results waiting to be uploaded.
+        """
+        return len(glob.glob(os.path.join(self.outbox_dir, '*.json')))
+
+    def _quarantine(self, path, reason):
+        """
+        Rename an outbox entry to .bad so it stops blocking the queue.
+        """
+        print(f"Skipping outbox entry {path}: {reason}")
+        os.replace(path, path + '.bad')
+
+    @staticmethod
+    def is_valid_entry(entry):
+        """
+        Check that an outbox entry has the fields the results store needs.
+        """
+        return (isinstance(entry, dict) and isinstance(entry.get('id'), str)
+                and isinstance(entry.get('kiosk'), str) and isinstance(entry.get('record'), dict))
+
+    @staticmethod
+    def is_permanent_failure(error):
+        """
+        Return True if the store rejected the upload itself, so retrying it can never succeed.
+        Timeouts, rate limiting, server errors, and responses that point at a wrong URL or
+        missing credentials (401, 403, 404, 405) are retried instead.
+        """
+        return (isinstance(error, urllib.error.HTTPError) and 400 <= error.code < 500
+                and error.code not in (401, 403, 404, 405, 408, 429))
+
+    def _load_pending(self):
+        """
+        Load pending entries, oldest first, as (path, entry) pairs.
+        Entries that cannot be read or are missing fields are quarantined.
+        """
+        pending = []
+        for path in sorted(glob.glob(os.path.join(self.outbox_dir, '*.json'))):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError) as e:
+                self._quarantine(path, f"unreadable ({e})")
+                continue
+            if not self.is_valid_entry(entry):
+                self._quarantine(path, "missing id, kiosk or record")
+                continue
+            pending.append((path, entry))
+        return pending
+
+    def _upload(self, entries):
+        """
+        POST one gzip-compressed batch to the results store.
+        Raises an exception if the store did not accept it.
+        """
+        body = gzip.compress(json.dumps({'kiosk': self.kiosk_id, 'results': entries}).encode('utf-8'))
+
+        request = urllib.request.Request(self.endpoint, data=body, method='POST', headers={
+            'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip'
+        })
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    def _send(self, batch):
+        """
+        Upload a batch of (path, entry) pairs and remove them from the outbox.
+        If the store rejects the batch permanently, the entries are sent one at a time
+        so only the ones it rejects are quarantined.
+
+        Returns:
+            int: Number of results uploaded
+        """
+        try:
+            self._upload([entry for _, entry in batch])
+        except urllib.error.HTTPError as e:
+            if not self.is_permanent_failure(e):
+                raise
+            if len(batch) == 1:
+                self._quarantine(batch[0][0], f"rejected by the results store ({e.code} {e.reason})")
+                return 0
+            return sum(self._send([item]) for item in batch)
+
+        for path, _ in batch:
+            os.remove(path)
+        return len(batch)
+
+    def sync_once(self):
+        """
+        Upload all pending results in batches.
+        Stops at the first batch that fails temporarily so results are delivered in order.
+
+        Returns:
+            int: Number of results uploaded
+        """
+        pending = self._load_pending()
+        uploaded = 0
+        for start in range(0, len(pending), self.batch_size):
+            uploaded += self._send(pending[start:start + self.batch_size])
+        return uploaded
+
+    def get_backoff(self):
+        """
+        Return the delay before the next retry, doubling with each failure (with jitter).
+        """
+        delay = min(self.max_backoff, 2 ** self.failures)
+        return delay * random.uniform(0.5, 1.0)
+
+    def start(self):
+        """
+        Start syncing in a background thread.
+        """
+        if not self.is_running:
+            self.is_running = True
+            self.stop_event.clear()
+            self.sync_thread = threading.Thread(target=self._run, daemon=True)
+            self.sync_thread.start()
+
+    def stop(self):
+        """
+        Stop the background thread. Pending results stay on disk for the next run.
+        """
+        self.is_running = False
+        self.stop_event.set()
+        self.wake_event.set()
+        if self.sync_thread:
+            self.sync_thread.join(timeout=self.timeout)
+
+    def _run(self):
+        """
+        Internal loop: sync, then wait for new results, the poll interval, or the retry delay.
+        """
+        while self.is_running:
+            self.wake_event.clear()
+            delay = self.poll_interval
+            try:
+                uploaded = self.sync_once()
+                if uploaded:
+                    print(f"Uploaded {uploaded} result(s) to {self.endpoint}")
+                self.failures = 0
+            except (OSError, urllib.error.URLError) as e:
+                self.failures += 1
+                delay = self.get_backoff()
+                print(f"Result sync failed ({e}); retrying in {delay:.0f}s")
+            except Exception as e:
+                # Keep the thread alive; anything unexpected is retried like a network error
+                self.failures += 1
+                delay = self.get_backoff()
+                print(f"Unexpected error during result sync ({e!r}); retrying in {delay:.0f}s")
+
+            if self.failures:
+                # Don't let new submissions cut the retry delay short
+                self.stop_event.wait(delay)
+            else:
+                self.wake_event.wait(delay)
+
+
+class ResultStoreHandler(BaseHTTPRequestHandler):
+    """
+    Minimal central results store for testing: accepts batches from ResultOutbox and
+    appends new results to a CSV file, ignoring any result ID it has already stored.
+    """
+    store_file = 'results/central_results.csv'
+    lock = threading.Lock()
+    seen_ids = None
+
+    @classmethod
+    def load_seen_ids(cls):
+        """
+        Read the IDs of results already in the store file.
+        """
+        cls.seen_ids = set()
+        if os.path.exists(cls.store_file):
+            with open(cls.store_file, newline='', encoding='utf-8') as f:
+                cls.seen_ids = {row['Result ID'] for row in csv.DictReader(f)}
+
+    def do_POST(self):
+        try:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if self.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            entries = json.loads(body)['results']
+            if not isinstance(entries, list):
+                raise ValueError("'results' must be a list")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self._respond(400, {'error': str(e)})
+            return
+
+        for entry in entries:
+            if not ResultOutbox.is_valid_entry(entry) or not set(entry['record']) <= set(STORE_COLUMNS):
+                self._respond(400, {'error': f"invalid result entry: {entry!r:.200}"})
+                return
+
+        with self.lock:
+            new_entries = [entry for entry in entries if entry['id'] not in self.seen_ids]
+            if new_entries:
+                os.makedirs(os.path.dirname(self.store_file) or '.', exist_ok=True)
+                write_header = not os.path.exists(self.store_file)
+                with open(self.store_file, 'a', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=STORE_COLUMNS)
+                    if write_header:
+                        writer.writeheader()
+                    for entry in new_entries:
+                        writer.writerow({'Result ID': entry['id'], 'Kiosk': entry['kiosk'], **entry['record']})
+                self.seen_ids.update(entry['id'] for entry in new_entries)
+
+        self._respond(200, {'accepted': len(new_entries), 'duplicates': len(entries) - len(new_entries)})
+
+    def _respond(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(port=8765, host='127.0.0.1', store_file='results/central_results.csv'):
+    """
+    Run the test results store until interrupted.
+    By default it only accepts connections from this machine; use host='0.0.0.0'
+    so kiosks on other machines can reach it.
+    """
+    ResultStoreHandler.store_file = store_file
+    ResultStoreHandler.load_seen_ids()
+    server = ThreadingHTTPServer((host, port), ResultStoreHandler)
+    print(f"Results store listening on http://{host}:{port}/results, writing to {store_file}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# Run the test store, or flush this kiosk's outbox once
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == 'serve':
+        serve(port=int(sys.argv[2]) if len(sys.argv) > 2 else 8765,
+              host=sys.argv[3] if len(sys.argv) > 3 else '127.0.0.1')
+    elif len(sys.argv) >= 3 and sys.argv[1] == 'sync':
+        outbox = ResultOutbox(sys.argv[2])
+        try:
+            print(f"Uploaded {outbox.sync_once()} result(s); {outbox.get_pending_count()} still pending")
+        except OSError as e:
+            print(f"Result sync failed ({e}); {outbox.get_pending_count()} result(s) still pending")
+            sys.exit(1)
+    else:
+        print("Usage: python -m src.result_sync serve [port] [host]\n"
+              "       python -m src.result_sync sync <store url>")
+        sys.exit(1)
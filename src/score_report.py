@@ -26,6 +26,7 @@ class ScoreReport:
         self.status = "Pass" if self.percentage >= 50 else "Fail"
         self.time_taken_seconds = time_taken_seconds
         self.time_taken_str = self.format_time(time_taken_seconds)
+        self.timestamp = None  # Set when the result is first recorded
 
         # File paths
         self.results_dir = "results"
@@ -46,6 +47,24 @@ class ScoreReport:
         secs = seconds % 60
         return f"{minutes:02d}:{secs:02d}"
 
+    def to_record(self):
+        """
+        Return the result as a single row, using the same columns as the results CSV.
+
+        Returns:
+            dict: Column name to value
+        """
+        if self.timestamp is None:
+            self.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return {
+            'Timestamp': self.timestamp,
+            'User Name': self.user_name,
+            'Score': f"{self.score}/{self.total_questions}",
+            'Percentage': f"{self.percentage:.2f}%",
+            'Status': self.status,
+            'Time Taken': self.time_taken_str
+        }
+
     def save_to_file(self):
         """
         Save the quiz results to a CSV file.
@@ -54,14 +73,7 @@ class ScoreReport:
         os.makedirs(self.results_dir, exist_ok=True)
 
         # Prepare data
-        data = {
-            'Timestamp': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-            'User Name': [self.user_name],
-            'Score': [f"{self.score}/{self.total_questions}"],
-            'Percentage': [f"{self.percentage:.2f}%"],
-            'Status': [self.status],
-            'Time Taken': [self.time_taken_str]
-        }
+        data = {column: [value] for column, value in self.to_record().items()}
 
         df = pd.DataFrame(data)
 
@@ -0,0 +1,229 @@
+import heapq
+import re
+import sys
+import time
+from bisect import bisect_left, insort
+
+# Words are runs of letters, digits or underscores; apostrophes are dropped so "isn't" matches "isnt"
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    Split text into lowercase search tokens.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Tokens in the order they appear
+    """
+    return TOKEN_PATTERN.findall(str(text).replace("'", "").lower())
+
+
+class QuestionSearchIndex:
+    """
+    Inverted index over question and option text for keyword search in a question bank.
+
+    Each distinct question text gets a stable document ID, so inserting or deleting a
+    question only reindexes that question rather than everything after it. Each token
+    maps to the set of document IDs containing it, and each document ID maps to its
+    positions in the current bank. A sorted vocabulary is kept alongside the postings so prefix queries are a
+    binary search plus a scan of the matching tokens.
+    """
+    # Above this many new tokens, re-sorting the vocabulary once beats inserting one by one
+    INSORT_LIMIT = 64
+    # Shorter prefixes match whole words only; expanding "a" would merge most of the index
+    MIN_PREFIX_LENGTH = 3
+
+    def __init__(self, quiz_data=None):
+        """
+        Initialize the index, optionally building it from a question source.
+
+        Args:
+            quiz_data: Any object with get_questions(), such as QuizData or SharedQuestionBank
+        """
+        self.postings = {}
+        self.vocabulary = []
+        self.doc_ids = {}
+        self.positions = {}
+        self.questions = []
+        self.next_doc_id = 0
+        if quiz_data is not None:
+            self.refresh(quiz_data)
+
+    @staticmethod
+    def _document_text(question):
+        """
+        Return the searchable text of a question dict as a tuple of fields.
+        The tuple is also the question's identity in the index.
+        """
+        options = question['options']
+        return (str(question['question']), str(options['A']), str(options['B']),
+                str(options['C']), str(options['D']))
+
+    def _add(self, doc_id, text, new_tokens):
+        """
+        Add the tokens of one question to the postings.
+        Tokens not seen before are appended to new_tokens for the vocabulary.
+        """
+        for token in set(tokenize(' '.join(text))):
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = set()
+                new_tokens.append(token)
+            postings.add(doc_id)
+
+    def _remove(self, doc_id, text):
+        """
+        Remove the tokens of one question from the postings.
+
+        Returns:
+            bool: True if any token no longer occurs in the bank
+        """
+        emptied = False
+        for token in set(tokenize(' '.join(text))):
+            postings = self.postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(doc_id)
+            if not postings:
+                del self.postings[token]
+                emptied = True
+        return emptied
+
+    def refresh(self, quiz_data):
+        """
+        Bring the index up to date with a (possibly changed) question bank.
+        Only questions that were added, removed or edited are reindexed; questions that
+        merely moved position keep their postings.
+
+        Args:
+            quiz_data: Any object with get_questions()
+
+        Returns:
+            int: Number of questions that were indexed or removed
+        """
+        self.questions = quiz_data.get_questions()
+        positions = {}
+        for index, question in enumerate(self.questions):
+            positions.setdefault(self._document_text(question), []).append(index)
+
+        removed = [text for text in self.doc_ids if text not in positions]
+        added = [text for text in positions if text not in self.doc_ids]
+
+        emptied = False
+        for text in removed:
+            emptied = self._remove(self.doc_ids.pop(text), text) or emptied
+        if emptied:
+            self.vocabulary = [token for token in self.vocabulary if token in self.postings]
+
+        new_tokens = []
+        for text in added:
+            self.doc_ids[text] = self.next_doc_id
+            self._add(self.next_doc_id, text, new_tokens)
+            self.next_doc_id += 1
+        if len(new_tokens) > self.INSORT_LIMIT:
+            self.vocabulary = sorted(self.vocabulary + new_tokens)
+        else:
+            for token in new_tokens:
+                insort(self.vocabulary, token)
+
+        self.positions = {self.doc_ids[text]: indexes for text, indexes in positions.items()}
+        return len(removed) + len(added)
+
+    def _matching_prefix(self, prefix, candidates=None):
+        """
+        Return the document IDs containing a token that starts with prefix.
+        If candidates is given, only those documents are considered, which keeps the
+        merge cheap when other terms have already narrowed the results.
+        """
+        matches = set()
+        position = bisect_left(self.vocabulary, prefix)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(prefix):
+            postings = self.postings[self.vocabulary[position]]
+            matches |= postings if candidates is None else candidates & postings
+            position += 1
+        return matches
+
+    def search(self, query, limit=20, prefix_last=True):
+        """
+        Find questions containing every word of the query.
+        A word ending in '*' is treated as a prefix; with prefix_last the final word is
+        always a prefix, which suits search-as-you-type. Prefixes shorter than
+        MIN_PREFIX_LENGTH match whole words only.
+
+        Args:
+            query (str): Keywords to search for
+            limit (int): Maximum number of results to return (None for all)
+            prefix_last (bool): Treat the last word as a prefix
+
+        Returns:
+            list: (position, question dict) tuples in bank order
+        """
+        words = query.split()
+        terms = []
+        for i, word in enumerate(words):
+            is_prefix = word.endswith('*') or (prefix_last and i == len(words) - 1)
+            for token in tokenize(word):
+                terms.append((token, is_prefix))
+        if not terms:
+            return []
+
+        exact_terms = [token for token, is_prefix in terms if not is_prefix or len(token) < self.MIN_PREFIX_LENGTH]
+        prefix_terms = [token for token, is_prefix in terms if is_prefix and len(token) >= self.MIN_PREFIX_LENGTH]
+
+        # Intersect the exact terms starting from the smallest posting list, then
+        # expand prefixes only within the documents that are still candidates
+        results = None
+        for postings in sorted((self.postings.get(token, set()) for token in exact_terms), key=len):
+            results = set(postings) if results is None else results & postings
+            if not results:
+                return []
+        for token in prefix_terms:
+            results = self._matching_prefix(token, results)
+            if not results:
+                return []
+
+        matched_positions = (position for doc_id in results for position in self.positions[doc_id])
+        if limit is None:
+            positions = sorted(matched_positions)
+        else:
+            positions = heapq.nsmallest(limit, matched_positions)
+        return [(position, self.questions[position]) for position in positions]
+
+    def get_total_questions(self):
+        """
+        Return the number of questions in the indexed bank.
+        """
+        return len(self.questions)
+
+    def get_total_tokens(self):
+        """
+        Return the number of distinct tokens in the index.
+        """
+        return len(self.vocabulary)
+
+
+# Search a question bank from the command line
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python -m src.search_index <quiz.csv> <keywords...>")
+        sys.exit(1)
+
+    from src.quiz_data import QuizData
+
+    quiz_data = QuizData(sys.argv[1])
+    start = time.perf_counter()
+    index = QuestionSearchIndex(quiz_data)
+    print(f"Indexed {index.get_total_questions()} questions ({index.get_total_tokens()} tokens) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    query = ' '.join(sys.argv[2:])
+    start = time.perf_counter()
+    results = index.search(query, limit=None)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(results)} match(es) for '{query}' in {elapsed_ms:.1f}ms")
+    for position, question in results[:50]:
+        options = '  '.join(f"{key}. {value}" for key, value in question['options'].items())
+        print(f"[{position + 1}] {question['question']}\n      {options}  (answer: {question['correct']})")
@@ -0,0 +1,213 @@
+import os
+import struct
+import sys
+import time
+from collections.abc import Sequence
+from multiprocessing import parent_process, resource_tracker, shared_memory
+
+# Columns stored for every question, in the order they are laid out in the blob
+FIELDS = ['question', 'option_a', 'option_b', 'option_c', 'option_d', 'correct_answer']
+
+# Header: magic, number of questions, size of the string blob in bytes, publisher PID
+HEADER = struct.Struct('<8sqqq')
+MAGIC = b'QMBANK02'
+OFFSET_SIZE = 8  # Offsets are stored as signed 64-bit integers
+
+
+class SharedQuestionBank(Sequence):
+    """
+    Read-only question bank stored in a multiprocessing shared memory block.
+
+    One process publishes the parsed bank with publish(); exam workers attach by name
+    and read questions straight out of the shared block, so the bank is held in memory
+    only once no matter how many workers are running.
+
+    Layout of the block:
+        header   - HEADER (magic, question count, blob size, publisher PID)
+        offsets  - (count * len(FIELDS) + 1) int64 start offsets into the blob;
+                   the end of each field is the start of the next one
+        blob     - UTF-8 encoded field text, concatenated
+    """
+    def __init__(self, name):
+        """
+        Attach to an already published question bank.
+
+        Args:
+            name (str): Name of the shared memory block returned by publish()
+        """
+        # Workers only read the bank; keep the resource tracker from unlinking the
+        # block when a worker exits, which is the publisher's job.
+        if sys.version_info >= (3, 13):
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.is_owner = False
+
+        # Check the header before touching the tracker, so a block that is not a
+        # question bank keeps whatever leak protection it had
+        self._map_block()
+
+        if sys.version_info < (3, 13) and os.name == 'posix' and not self._shares_publisher_tracker():
+            try:
+                resource_tracker.unregister('/' + self.name, 'shared_memory')
+            except OSError as e:
+                print(f"Warning: could not untrack shared memory block '{self.name}': {e}")
+
+    @classmethod
+    def publish(cls, quiz_data, name=None):
+        """
+        Copy the questions of a QuizData instance into a new shared memory block.
+
+        Args:
+            quiz_data (QuizData): Loaded quiz data to publish
+            name (str): Optional name for the shared memory block
+
+        Returns:
+            SharedQuestionBank: The owning bank; call unlink() when it is no longer needed
+        """
+        df = quiz_data.questions_df
+        count = len(df) if df is not None and not df.empty else 0
+
+        # Encode every field and record where it starts in the blob
+        chunks = []
+        offsets = []
+        position = 0
+        if count:
+            columns = [df[field].tolist() for field in FIELDS]
+            for values in zip(*columns):
+                for value in values:
+                    encoded = str(value).encode('utf-8')
+                    offsets.append(position)
+                    chunks.append(encoded)
+                    position += len(encoded)
+        offsets.append(position)
+        blob = b''.join(chunks)
+
+        offsets_size = len(offsets) * OFFSET_SIZE
+        size = HEADER.size + offsets_size + len(blob)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        HEADER.pack_into(shm.buf, 0, MAGIC, count, len(blob), os.getpid())
+        struct.pack_into(f'<{len(offsets)}q', shm.buf, HEADER.size, *offsets)
+        blob_start = HEADER.size + offsets_size
+        shm.buf[blob_start:blob_start + len(blob)] = blob
+
+        bank = cls.__new__(cls)
+        bank.shm = shm
+        bank.name = shm.name
+        bank.is_owner = True
+        bank._map_block()
+        print(f"Published {count} questions to shared memory block '{bank.name}' ({size} bytes)")
+        return bank
+
+    def _map_block(self):
+        """
+        Read the header and set up zero-copy views over the offsets and the blob.
+        """
+        if self.shm.size < HEADER.size or HEADER.unpack_from(self.shm.buf, 0)[0] != MAGIC:
+            self.shm.close()
+            raise ValueError(f"Shared memory block '{self.name}' is not a question bank.")
+
+        magic, count, blob_size, self.publisher_pid = HEADER.unpack_from(self.shm.buf, 0)
+        offsets_end = HEADER.size + (count * len(FIELDS) + 1) * OFFSET_SIZE
+        self.count = count
+        self._offsets = self.shm.buf[HEADER.size:offsets_end].cast('q')
+        self._blob = self.shm.buf[offsets_end:offsets_end + blob_size]
+
+    def _shares_publisher_tracker(self):
+        """
+        Return True if this process reports to the publisher's resource tracker.
+        That is the case in the publisher itself and in workers it started with
+        multiprocessing, which inherit its tracker. Unregistering the block there would
+        remove the publisher's own registration, so only independent workers untrack it.
+        """
+        return self.publisher_pid == os.getpid() or parent_process() is not None
+
+    def _field(self, slot):
+        """
+        Decode a single field from the blob.
+        """
+        start = self._offsets[slot]
+        end = self._offsets[slot + 1]
+        return str(self._blob[start:end], 'utf-8')
+
+    def get_question(self, index):
+        """
+        Return one question in the same format as QuizData.get_questions().
+
+        Args:
+            index (int): Position of the question in the bank
+
+        Returns:
+            dict: {'question': str, 'options': {'A': str, 'B': str, 'C': str, 'D': str}, 'correct': str}
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("question index out of range")
+
+        base = index * len(FIELDS)
+        question, a, b, c, d, correct = (self._field(base + i) for i in range(len(FIELDS)))
+        return {
+            'question': question,
+            'options': {'A': a, 'B': b, 'C': c, 'D': d},
+            'correct': correct
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.get_question(i) for i in range(*index.indices(self.count))]
+        return self.get_question(index)
+
+    def __len__(self):
+        return self.count
+
+    def get_questions(self):
+        """
+        Return the bank itself as a read-only sequence of question dicts.
+        Questions are decoded on access, so no per-worker copy of the bank is built.
+        """
+        return self
+
+    def get_total_questions(self):
+        """
+        Return the total number of questions in the bank.
+        """
+        return self.count
+
+    def close(self):
+        """
+        Release this process's views of the shared memory block.
+        """
+        self._offsets.release()
+        self._blob.release()
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Close and destroy the shared memory block. Only the publisher should call this.
+        """
+        self.close()
+        if self.is_owner:
+            self.shm.unlink()
+
+
+# Publish a bank from the command line and keep it alive for workers to attach to
+if __name__ == "__main__":
+    from src.quiz_data import QuizData
+
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'data/sample_quiz.csv'
+    name = sys.argv[2] if len(sys.argv) > 2 else None
+
+    quiz_data = QuizData(file_path)
+    if quiz_data.validate_data():
+        bank = SharedQuestionBank.publish(quiz_data, name=name)
+        print(f"Workers can attach with QUIZ_SHARED_BANK={bank.name}. Press Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            bank.unlink()
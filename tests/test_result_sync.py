@@ -0,0 +1,205 @@
+import csv
+import gzip
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from src.result_sync import ResultOutbox, ResultStoreHandler
+
+RECORD = {
+    'Timestamp': '2026-10-19 09:00:00',
+    'User Name': 'Ada',
+    'Score': '8/10',
+    'Percentage': '80.00%',
+    'Status': 'Pass',
+    'Time Taken': '04:12'
+}
+
+
+def make_report(**changes):
+    return SimpleNamespace(to_record=lambda: {**RECORD, **changes})
+
+
+@pytest.fixture
+def store(tmp_path):
+    """
+    Run a results store on a free local port; yields (url, store file path).
+    """
+    handler = type('Handler', (ResultStoreHandler,), {
+        'store_file': str(tmp_path / 'central.csv'),
+        'lock': threading.Lock(),
+        'log_message': lambda self, *args: None
+    })
+    handler.load_seen_ids()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/results", handler.store_file
+    server.shutdown()
+    server.server_close()
+
+
+def stored_rows(store_file):
+    if not os.path.exists(store_file):
+        return []
+    with open(store_file, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def make_outbox(tmp_path, endpoint, **kwargs):
+    return ResultOutbox(endpoint, outbox_dir=str(tmp_path / 'outbox'), kiosk_id='kiosk-1', **kwargs)
+
+
+def test_enqueue_writes_durable_entry(tmp_path):
+    outbox = make_outbox(tmp_path, 'http://127.0.0.1:9/results')
+    result_id = outbox.enqueue(make_report())
+    files = os.listdir(outbox.outbox_dir)
+    assert len(files) == 1 and files[0].endswith(f"{result_id}.json")
+    with open(os.path.join(outbox.outbox_dir, files[0]), encoding='utf-8') as f:
+        assert json.load(f) == {'id': result_id, 'kiosk': 'kiosk-1', 'record': RECORD}
+
+
+def test_sync_uploads_in_batches_and_empties_outbox(tmp_path, store):
+    url, store_file = store
+    outbox = make_outbox(tmp_path, url, batch_size=2)
+    ids = [outbox.enqueue(make_report(**{'User Name': f"user{i}"})) for i in range(5)]
+
+    assert outbox.sync_once() == 5
+    assert outbox.get_pending_count() == 0
+    rows = stored_rows(store_file)
+    assert [row['Result ID'] for row in rows] == ids
+    assert rows[0]['Kiosk'] == 'kiosk-1'
+    assert rows[4]['User Name'] == 'user4'
+
+
+def test_store_ignores_results_it_already_has(tmp_path, store):
+    url, store_file = store
+    outbox = make_outbox(tmp_path, url)
+    result_id = outbox.enqueue(make_report())
+    outbox.sync_once()
+
+    # Replay the same result, as a retry after a lost response would
+    entry = {'id': result_id, 'kiosk': 'kiosk-1', 'record': RECORD}
+    body = gzip.compress(json.dumps({'results': [entry]}).encode('utf-8'))
+    request = urllib.request.Request(url, data=body, headers={'Content-Encoding': 'gzip'})
+    with urllib.request.urlopen(request) as response:
+        assert json.load(response) == {'accepted': 0, 'duplicates': 1}
+    assert len(stored_rows(store_file)) == 1
+
+
+def test_unreachable_store_keeps_results(tmp_path):
+    outbox = make_outbox(tmp_path, 'http://127.0.0.1:9/results', timeout=1)
+    outbox.enqueue(make_report())
+    with pytest.raises(OSError):
+        outbox.sync_once()
+    assert outbox.get_pending_count() == 1
+
+
+def test_entry_missing_fields_is_quarantined(tmp_path, store):
+    url, store_file = store
+    outbox = make_outbox(tmp_path, url)
+    bad_path = os.path.join(outbox.outbox_dir, '0_bad.json')
+    with open(bad_path, 'w', encoding='utf-8') as f:
+        json.dump({'kiosk': 'kiosk-1', 'record': RECORD}, f)
+    with open(os.path.join(outbox.outbox_dir, '0_corrupt.json'), 'w', encoding='utf-8') as f:
+        f.write('{not json')
+    outbox.enqueue(make_report())
+
+    assert outbox.sync_once() == 1
+    assert os.path.exists(bad_path + '.bad')
+    assert outbox.get_pending_count() == 0
+    assert len(stored_rows(store_file)) == 1
+
+
+def test_rejected_entry_does_not_block_the_batch(tmp_path, store):
+    url, store_file = store
+    outbox = make_outbox(tmp_path, url)
+    first = outbox.enqueue(make_report())
+    outbox.enqueue(make_report(Unknown='column'))  # the store answers 400 for this one
+    last = outbox.enqueue(make_report())
+
+    assert outbox.sync_once() == 2
+    assert [row['Result ID'] for row in stored_rows(store_file)] == [first, last]
+    assert outbox.get_pending_count() == 0
+    assert len([name for name in os.listdir(outbox.outbox_dir) if name.endswith('.bad')]) == 1
+
+
+@pytest.mark.parametrize('code, permanent', [
+    (400, True), (413, True), (422, True),
+    (404, False), (408, False), (429, False), (500, False), (503, False)
+])
+def test_permanent_failures(code, permanent):
+    error = urllib.error.HTTPError('http://store/results', code, 'status', {}, None)
+    assert ResultOutbox.is_permanent_failure(error) is permanent
+
+
+def test_temporary_http_error_keeps_results(tmp_path, monkeypatch):
+    outbox = make_outbox(tmp_path, 'http://store/results')
+    outbox.enqueue(make_report())
+
+    def unavailable(entries):
+        raise urllib.error.HTTPError(outbox.endpoint, 503, 'Service Unavailable', {}, None)
+    monkeypatch.setattr(outbox, '_upload', unavailable)
+
+    with pytest.raises(urllib.error.HTTPError):
+        outbox.sync_once()
+    assert outbox.get_pending_count() == 1
+
+
+def test_backoff_doubles_and_is_capped(tmp_path):
+    outbox = make_outbox(tmp_path, 'http://store/results', max_backoff=10)
+    outbox.failures = 3
+    assert 4 <= outbox.get_backoff() <= 8
+    outbox.failures = 20
+    assert 5 <= outbox.get_backoff() <= 10
+
+
+def test_sync_thread_survives_unexpected_errors(tmp_path, store, monkeypatch):
+    url, store_file = store
+    outbox = make_outbox(tmp_path, url, poll_interval=0.05)
+    monkeypatch.setattr(outbox, 'get_backoff', lambda: 0.05)
+
+    real_sync_once = outbox.sync_once
+    calls = []
+
+    def flaky_sync_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+        return real_sync_once()
+    monkeypatch.setattr(outbox, 'sync_once', flaky_sync_once)
+
+    outbox.enqueue(make_report())
+    outbox.start()
+    try:
+        deadline = time.time() + 5
+        while outbox.get_pending_count() and time.time() < deadline:
+            time.sleep(0.05)
+        assert outbox.sync_thread.is_alive()
+    finally:
+        outbox.stop()
+    assert outbox.get_pending_count() == 0
+    assert len(stored_rows(store_file)) == 1
+
+
+def test_sync_cli_reports_unreachable_store(tmp_path):
+    outbox = ResultOutbox('http://127.0.0.1:9/results', outbox_dir=str(tmp_path / 'results' / 'outbox'))
+    outbox.enqueue(make_report())
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    result = subprocess.run([sys.executable, '-m', 'src.result_sync', 'sync', 'http://127.0.0.1:9/results'],
+                            cwd=tmp_path, env={**os.environ, 'PYTHONPATH': repo_root},
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 1
+    assert 'Traceback' not in result.stderr
+    assert 'Result sync failed' in result.stdout
+    assert '1 result(s) still pending' in result.stdout
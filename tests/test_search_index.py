@@ -0,0 +1,135 @@
+from src.search_index import QuestionSearchIndex, tokenize
+
+
+class FakeBank:
+    """
+    Minimal question source: anything with get_questions() can be indexed.
+    """
+    def __init__(self, questions):
+        self.questions = questions
+
+    def get_questions(self):
+        return self.questions
+
+
+def make_question(text, a='Yes', b='No', c='Maybe', d='Never', correct='A'):
+    return {'question': text, 'options': {'A': a, 'B': b, 'C': c, 'D': d}, 'correct': correct}
+
+
+def make_bank():
+    return FakeBank([
+        make_question("What is the color of grass?", 'Green', 'Blue', 'Red', 'Yellow'),
+        make_question("What do cows drink?", 'Water', 'Milk', 'Juice', 'Soda'),
+        make_question("What animal says 'meow'?", 'Cat', 'Dog', 'Cow', 'Sheep'),
+        make_question("What is the color of snow?", 'White', 'Black', 'Blue', 'Red'),
+    ])
+
+
+def positions(results):
+    return [position for position, _ in results]
+
+
+def assert_consistent(index):
+    assert index.vocabulary == sorted(index.postings)
+
+
+def test_tokenize():
+    assert tokenize("What animal says 'meow'? Isn't it 2x") == ['what', 'animal', 'says', 'meow', 'isnt', 'it', '2x']
+
+
+def test_keyword_search_matches_all_words():
+    index = QuestionSearchIndex(make_bank())
+    assert positions(index.search("color grass", prefix_last=False)) == [0]
+    assert positions(index.search("color", prefix_last=False)) == [0, 3]
+    assert positions(index.search("milk")) == [1]  # option text is searchable
+    assert index.search("   ") == []
+    assert index.search("penguin") == []
+
+
+def test_prefix_queries():
+    index = QuestionSearchIndex(make_bank())
+    assert positions(index.search("col")) == [0, 3]
+    assert positions(index.search("col", prefix_last=False)) == []
+    assert positions(index.search("gra* color", prefix_last=False)) == [0]
+    assert positions(index.search("color whi")) == [3]
+    assert positions(index.search("cow")) == [1, 2]  # "cows" and the option "Cow"
+    assert positions(index.search("cow", prefix_last=False)) == [2]
+
+
+def test_short_prefixes_match_whole_words():
+    bank = FakeBank([make_question("A cat"), make_question("An apple"), make_question("Cats sit")])
+    index = QuestionSearchIndex(bank)
+    assert positions(index.search("a")) == [0]
+    assert positions(index.search("ca")) == []
+    assert positions(index.search("cat")) == [0, 2]
+
+
+def test_prefix_is_filtered_by_exact_terms():
+    bank = FakeBank([make_question("Green grass"), make_question("Green grapes"), make_question("Red grapes")])
+    index = QuestionSearchIndex(bank)
+    assert positions(index.search("green gra")) == [0, 1]
+    assert positions(index.search("red gra")) == [2]
+    assert index.search("red grass") == []
+    assert positions(index.search("gre* gra*", prefix_last=False)) == [0, 1]
+
+
+def test_limit_returns_first_matches_in_bank_order():
+    bank = FakeBank([make_question(f"Question number {i}") for i in range(100)])
+    index = QuestionSearchIndex(bank)
+    assert positions(index.search("question", limit=3)) == [0, 1, 2]
+    assert len(index.search("question", limit=None)) == 100
+
+
+def test_refresh_only_reindexes_changed_questions():
+    bank = make_bank()
+    index = QuestionSearchIndex(bank)
+    assert index.refresh(bank) == 0
+
+    # Deleting the first question shifts every position but only removes one document
+    del bank.questions[0]
+    assert index.refresh(bank) == 1
+    assert index.search("grass") == []
+    assert positions(index.search("snow")) == [2]
+
+    # Inserting at the top only adds one document
+    bank.questions.insert(0, make_question("Where do fish live?", 'Sea'))
+    assert index.refresh(bank) == 1
+    assert positions(index.search("fish")) == [0]
+    assert positions(index.search("snow")) == [3]
+
+    # Editing a question replaces it
+    bank.questions[1] = make_question("What do goats drink?", 'Water')
+    assert index.refresh(bank) == 2
+    assert index.search("cows") == []
+    assert positions(index.search("goats")) == [1]
+    assert_consistent(index)
+
+
+def test_removed_tokens_leave_vocabulary():
+    bank = make_bank()
+    index = QuestionSearchIndex(bank)
+    assert 'grass' in index.vocabulary
+    del bank.questions[0]
+    index.refresh(bank)
+    assert 'grass' not in index.vocabulary
+    assert index.search("gra") == []
+    assert_consistent(index)
+
+
+def test_duplicate_questions_keep_every_position():
+    bank = FakeBank([make_question("Same question"), make_question("Other"), make_question("Same question")])
+    index = QuestionSearchIndex(bank)
+    assert positions(index.search("same")) == [0, 2]
+    del bank.questions[0]
+    assert index.refresh(bank) == 0
+    assert positions(index.search("same")) == [1]
+
+
+def test_bulk_and_incremental_vocabulary_stay_sorted():
+    bank = FakeBank([make_question(f"Word{i} topic{i % 7}") for i in range(500)])
+    index = QuestionSearchIndex(bank)
+    assert_consistent(index)
+    bank.questions.append(make_question("Brand new zebra"))
+    assert index.refresh(bank) == 1
+    assert_consistent(index)
+    assert positions(index.search("zeb")) == [500]
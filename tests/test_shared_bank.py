@@ -0,0 +1,185 @@
+import os
+import struct
+import subprocess
+import sys
+import textwrap
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+
+import pytest
+
+from src.shared_bank import FIELDS, HEADER, SharedQuestionBank
+
+
+class FakeFrame(dict):
+    """
+    Stands in for the pandas DataFrame QuizData holds: column name -> list of cell text.
+    """
+    def __getitem__(self, column):
+        return SimpleNamespace(tolist=lambda: list(dict.__getitem__(self, column)))
+
+    def __len__(self):
+        return len(dict.__getitem__(self, 'question'))
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+
+def make_quiz_data(rows):
+    columns = {field: [row[i] for row in rows] for i, field in enumerate(FIELDS)}
+    return SimpleNamespace(questions_df=FakeFrame(columns))
+
+
+ROWS = [
+    ('What is 1 + 1?', '2', '3', '4', '5', 'A'),
+    ('Which one is café?', 'café', 'tea', '', 'juice', 'A'),
+    ('What do bees make?', 'Honey', 'Milk', 'Juice', 'Soda', 'A'),
+]
+
+
+@pytest.fixture
+def bank():
+    bank = SharedQuestionBank.publish(make_quiz_data(ROWS))
+    yield bank
+    bank.unlink()
+
+
+def read_attached_bank(name):
+    worker = SharedQuestionBank(name)
+    try:
+        return len(worker), worker[1]['options']['A']
+    finally:
+        worker.close()
+
+
+def test_round_trip_matches_source_rows(bank):
+    assert len(bank) == bank.get_total_questions() == 3
+    assert bank[0] == {
+        'question': 'What is 1 + 1?',
+        'options': {'A': '2', 'B': '3', 'C': '4', 'D': '5'},
+        'correct': 'A'
+    }
+    assert bank[1]['options'] == {'A': 'café', 'B': 'tea', 'C': '', 'D': 'juice'}
+    assert bank[-1]['question'] == 'What do bees make?'
+    assert [q['question'] for q in bank[0:2]] == [ROWS[0][0], ROWS[1][0]]
+
+
+def test_index_out_of_range(bank):
+    with pytest.raises(IndexError):
+        bank[3]
+
+
+def test_layout_offsets_point_into_blob(bank):
+    magic, count, blob_size, publisher_pid = HEADER.unpack_from(bank.shm.buf, 0)
+    assert publisher_pid == os.getpid()
+    offsets = struct.unpack_from(f'<{count * len(FIELDS) + 1}q', bank.shm.buf, HEADER.size)
+    assert count == 3
+    assert offsets[0] == 0
+    assert offsets[-1] == blob_size
+    assert list(offsets) == sorted(offsets)
+
+
+def test_empty_bank():
+    bank = SharedQuestionBank.publish(make_quiz_data([]))
+    try:
+        assert len(bank) == 0
+        assert list(bank.get_questions()) == []
+    finally:
+        bank.unlink()
+
+
+# Runs as its own program so the resource tracker's stderr can be checked: the
+# tracker is a separate process and prints problems there instead of raising.
+TRACKER_SCRIPT = textwrap.dedent('''
+    import multiprocessing
+    import subprocess
+    import sys
+    from multiprocessing import shared_memory
+    from types import SimpleNamespace
+
+    from src.shared_bank import SharedQuestionBank
+
+    ATTACH = (
+        "import sys; from src.shared_bank import SharedQuestionBank; "
+        "bank = SharedQuestionBank(sys.argv[1]); print(len(bank)); bank.close()"
+    )
+
+    class Frame(dict):
+        empty = False
+
+        def __getitem__(self, column):
+            return SimpleNamespace(tolist=lambda: dict.__getitem__(self, column))
+
+        def __len__(self):
+            return len(dict.__getitem__(self, 'question'))
+
+    def read_attached_bank(name):
+        worker = SharedQuestionBank(name)
+        try:
+            return len(worker), worker[0]['question']
+        finally:
+            worker.close()
+
+    if __name__ == '__main__':
+        rows = {'question': ['Q1', 'Q2'], 'option_a': ['a', 'b'], 'option_b': ['a', 'b'],
+                'option_c': ['a', 'b'], 'option_d': ['a', 'b'], 'correct_answer': ['A', 'B']}
+        bank = SharedQuestionBank.publish(SimpleNamespace(questions_df=Frame(rows)))
+
+        # Workers started by the publisher share its resource tracker
+        for method in ('spawn', 'fork'):
+            with multiprocessing.get_context(method).Pool(1) as pool:
+                assert pool.apply(read_attached_bank, (bank.name,)) == (2, 'Q1')
+
+        # An independent worker has its own tracker; exiting must not destroy the block
+        output = subprocess.run([sys.executable, '-c', ATTACH, bank.name], capture_output=True, text=True, check=True)
+        assert output.stdout.strip() == '2', output.stderr
+
+        # The publisher can attach to its own bank
+        assert read_attached_bank(bank.name) == (2, 'Q1')
+
+        # A block that is not a question bank is rejected and keeps its registration
+        foreign = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            SharedQuestionBank(foreign.name)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('foreign block was accepted')
+        foreign.close()
+        foreign.unlink()
+
+        bank.unlink()
+        print('ok')
+''')
+
+
+def test_workers_leave_resource_tracker_consistent(tmp_path):
+    script = tmp_path / 'tracker_check.py'
+    script.write_text(TRACKER_SCRIPT)
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, 'PYTHONPATH': repo_root}
+
+    result = subprocess.run([sys.executable, str(script)], cwd=repo_root, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith('ok')
+    # The tracker reports unregistering an unknown block (KeyError) or unlinking a leaked one here
+    assert 'Traceback' not in result.stderr
+    assert 'leaked' not in result.stderr
+    assert 'KeyError' not in result.stderr
+
+
+def test_attach_rejects_foreign_block():
+    shm = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            SharedQuestionBank(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_attach_missing_block():
+    with pytest.raises(FileNotFoundError):
+        SharedQuestionBank('quiz_master_no_such_bank')